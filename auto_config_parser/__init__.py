@@ -12,8 +12,10 @@ Example
 # ... later, someone edits settings.ini and saves it ...
 >>> print(parser.get("section", "key"))  # value is automatically refreshed
 
-The watcher runs in a background thread. Call ``close()`` or use the parser
-as a context manager to stop it when you are done.
+Events are dispatched by a background observer thread shared by all
+parsers; watchdog still runs one emitter per watched path. Call
+``close()`` or use the parser as a context manager to stop watching the file
+when you are done.
 """
 
 from .auto_config_parser import AutoConfigParser
@@ -3,38 +3,416 @@
 Implementation of `AutoConfigParser`, a subclass of ``configparser.ConfigParser``
 that automatically reloads the INI file as soon as it changes on disk using the
 ``watchdog`` package. The watcher runs in a background thread managed by a
-``watchdog.observers.Observer``.
+``watchdog.observers.Observer`` that is shared by every parser in the process.
 """
 from __future__ import annotations
 
+import collections
+import contextlib
+import hashlib
+import io
+import logging
+import os
+import stat
+import tempfile
 import threading
+import weakref
 from pathlib import Path
 import configparser
-from typing import Any, Iterable, Mapping, Union
+from typing import Any, Deque, Dict, Iterable, Mapping, Optional, Set, Tuple, Type, Union
 
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import (
+    DirCreatedEvent,
+    DirDeletedEvent,
+    DirMovedEvent,
+    FileClosedEvent,
+    FileCreatedEvent,
+    FileDeletedEvent,
+    FileModifiedEvent,
+    FileMovedEvent,
+    FileSystemEvent,
+    FileSystemEventHandler,
+)
 from watchdog.observers import Observer
+from watchdog.observers.api import BaseObserver, ObservedWatch
+from watchdog.observers.polling import PollingObserver
 
 __all__ = ["AutoConfigParser"]
 
+_logger = logging.getLogger(__name__)
+
+# The inotify backend reports IN_CLOSE_WRITE as ``on_closed``. When that is
+# available a save is picked up once, when the writer closes the file, instead
+# of on each of the several IN_MODIFY events a single save can produce.
+_EMITS_CLOSE_EVENTS = Observer.__name__ == "InotifyObserver"
+
+#: environment variable consulted when no ``poll_interval`` is passed
+POLL_INTERVAL_ENV = "AUTO_CONFIG_PARSER_POLL_INTERVAL"
+_DEFAULT_POLL_INTERVAL = 1.0
+_MIN_POLL_INTERVAL = 0.1
+
+# entries kept in the ``get`` result cache before it is emptied
+_GET_CACHE_SIZE = 512
+
+# Events requested for the config file itself and for the directories on its
+# path. Directories only need to report entries appearing, disappearing or
+# being renamed (atomic saves, recreated files, repointed symlinks); content
+# changes come from the watch on the file, so writes to unrelated files in the
+# same directory are filtered out by the kernel instead of being dispatched.
+_FILE_EVENTS: Tuple[Type[FileSystemEvent], ...] = (FileClosedEvent, FileDeletedEvent, FileMovedEvent)
+_DIR_EVENTS: Tuple[Type[FileSystemEvent], ...] = (
+    DirCreatedEvent, DirDeletedEvent, DirMovedEvent,
+    FileCreatedEvent, FileDeletedEvent, FileMovedEvent,
+)
+
+# a path to watch and the event types to watch it for
+_Watch = Tuple[str, Tuple[Type[FileSystemEvent], ...]]
+
+# bytes asked for per ``os.read`` beyond the size ``fstat`` reports
+_READ_CHUNK_SIZE = 64 * 1024
+
+# filesystems on which inotify does not see changes made by other hosts
+_REMOTE_FS_TYPES = frozenset(
+    {
+        "9p", "afs", "ceph", "cifs", "fuse.glusterfs", "fuse.sshfs", "glusterfs",
+        "gpfs", "lustre", "ncpfs", "nfs", "nfs4", "smb3", "smbfs", "sshfs",
+    }
+)
+
+
+def _env_poll_interval() -> Optional[float]:
+    """Return the poll interval set in the environment, or ``None``.
+
+    A value that is not a number is ignored with a warning rather than
+    failing every parser constructed in the process.
+    """
+    value = os.environ.get(POLL_INTERVAL_ENV)
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        _logger.warning("Ignoring %s=%r: not a number of seconds", POLL_INTERVAL_ENV, value)
+        return None
+
+
+def _is_remote_fs(path: Path) -> bool:
+    """Best-effort check whether *path* lives on a network filesystem.
+
+    Only Linux exposes the information needed (``/proc/self/mounts``); on
+    other platforms, or if it cannot be read, the path is assumed local.
+    """
+    try:
+        with open("/proc/self/mounts", encoding="utf-8") as f:
+            mounts = f.read().splitlines()
+    except OSError:
+        return False
+
+    target = path.as_posix()
+    best_mount, best_type = "", ""
+    for line in mounts:
+        fields = line.split()
+        if len(fields) < 3:
+            continue
+        # /proc/mounts escapes whitespace in mount points as octal
+        mount_point = fields[1].replace("\\040", " ").replace("\\011", "\t")
+        prefix = mount_point.rstrip("/") + "/"
+        if (target == mount_point or target.startswith(prefix)) and len(mount_point) >= len(best_mount):
+            best_mount, best_type = mount_point, fields[2]
+    return best_type in _REMOTE_FS_TYPES
+
+
+def _normalize(path: str) -> str:
+    """Return *path* in the one form event and target paths are compared in.
+
+    watchdog joins entry names onto the watched path with the native
+    separator, so on Windows an event can mix ``/`` and ``\\``.
+    """
+    return os.path.normcase(os.path.normpath(path))
+
+
+def _path_identity(path: str) -> Optional[Tuple[int, int]]:
+    """Return ``(st_dev, st_ino)`` of what *path* refers to, or ``None``."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+def _interpolation_marker(interpolation: configparser.Interpolation) -> Optional[str]:
+    """Return the text that starts interpolation syntax for *interpolation*.
+
+    Values without it are returned unchanged by ``before_get``. ``""`` means
+    no value is ever changed, and ``None`` that the interpolation is not one
+    of the stdlib ones and must always be applied.
+    """
+    kind = type(interpolation)
+    if kind is configparser.Interpolation:
+        return ""
+    if kind is configparser.BasicInterpolation:
+        return "%"
+    if kind is configparser.ExtendedInterpolation:
+        return "$"
+    return None
+
+
+class _SharedObservers:
+    """Observer threads shared by all parsers, one per watching backend.
+
+    Every parser using native notifications shares one ``Observer`` (and
+    every parser polling at a given interval one ``PollingObserver``), which
+    dispatches all of their events. This is not a single notification
+    descriptor: watchdog gives every watched path its own emitter (with
+    native notifications, its own inotify instance and reader thread), so the
+    thread and descriptor count grows with the number of distinct paths
+    watched. Parsers watching the same path share its emitter, which is
+    dropped with its last handler, so parsers of files in one directory
+    share that directory's.
+
+    Handlers must not call back into this class from the observer thread,
+    since watchdog holds its own lock while dispatching events and the
+    methods here take that lock while holding ours.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._observers: Dict[Optional[float], BaseObserver] = {}
+        # (poll_interval, path, event types) -> (watch, identity of the
+        # watched inode, handlers)
+        self._watches: Dict[
+            Tuple[Optional[float], str, Tuple[Type[FileSystemEvent], ...]],
+            Tuple[ObservedWatch, Tuple[int, int], Set[FileSystemEventHandler]],
+        ] = {}
+        # releases queued by garbage-collected parsers, see defer_release
+        self._pending: Deque[
+            Tuple[Optional[float], FileSystemEventHandler, Set[_Watch]]
+        ] = collections.deque()
+
+    def observer(self, poll_interval: Optional[float]) -> BaseObserver:
+        """Return the running observer for *poll_interval*, starting it if needed.
+
+        Observers are daemon threads that live for the rest of the process,
+        so creating and closing parsers never pays for thread start-up and
+        teardown; an observer with nothing scheduled just waits on its queue.
+        """
+        with self._lock:
+            observer = self._observers.get(poll_interval)
+            if observer is None:
+                if poll_interval is None:
+                    observer = Observer()
+                else:
+                    observer = PollingObserver(timeout=poll_interval)
+                observer.daemon = True
+                observer.start()
+                self._observers[poll_interval] = observer
+            return observer
+
+    def watch(
+        self, poll_interval: Optional[float], handler: FileSystemEventHandler, target: _Watch
+    ) -> bool:
+        """Deliver events for *target* to *handler*; return whether it is watched.
+
+        *target* is a path and the event types wanted for it. If the path now
+        refers to a different inode than when its emitter was created (a
+        recreated file or a repointed symlink), the emitter is replaced for
+        all of its handlers. Missing paths are not watched.
+        """
+        path, events = target
+        with self._lock:
+            self._drain_locked()
+            observer = self._observers[poll_interval]
+            key = (poll_interval, path, events)
+            identity = _path_identity(path)
+            entry = self._watches.get(key)
+            if entry is not None and entry[1] == identity:
+                if handler not in entry[2]:
+                    observer.add_handler_for_watch(handler, entry[0])
+                    entry[2].add(handler)
+                return True
+
+            handlers = {handler}
+            if entry is not None:
+                observer.unschedule(entry[0])
+                del self._watches[key]
+                handlers |= entry[2]
+            if identity is None:
+                return False
+            for each in handlers:
+                watch = observer.schedule(each, path, recursive=False, event_filter=list(events))
+            self._watches[key] = (watch, identity, handlers)
+            return True
+
+    def unwatch(
+        self, poll_interval: Optional[float], handler: FileSystemEventHandler, target: _Watch
+    ) -> None:
+        """Stop delivering events for *target* to *handler*."""
+        with self._lock:
+            self._drain_locked()
+            self._unwatch_locked(poll_interval, handler, target)
+
+    def release(
+        self, poll_interval: Optional[float], handler: FileSystemEventHandler, watched: Set[_Watch]
+    ) -> None:
+        """Stop delivering events for everything in *watched* to *handler*."""
+        with self._lock:
+            self._drain_locked()
+            self._release_locked(poll_interval, handler, watched)
+
+    def defer_release(
+        self, poll_interval: Optional[float], handler: FileSystemEventHandler, watched: Set[_Watch]
+    ) -> None:
+        """Queue a :meth:`release` for the next call that takes the lock.
+
+        This is a parser's finalizer. Parsers are only freed by the cyclic
+        garbage collector, which can run on any thread at any allocation,
+        including one made while ``_lock`` (or a handler's timer lock) is
+        held, so it must not take locks; appending to a deque does not.
+        """
+        self._pending.append((poll_interval, handler, watched))
+
+    def release_pending(self) -> None:
+        """Carry out the releases queued by :meth:`defer_release`."""
+        with self._lock:
+            self._drain_locked()
+
+    def _drain_locked(self) -> None:
+        while self._pending:
+            try:
+                released = self._pending.popleft()
+            except IndexError:  # pragma: no cover - drained concurrently
+                break
+            self._release_locked(*released)
+
+    def _release_locked(
+        self, poll_interval: Optional[float], handler: FileSystemEventHandler, watched: Set[_Watch]
+    ) -> None:
+        for target in watched:
+            self._unwatch_locked(poll_interval, handler, target)
+        watched.clear()
+
+    def _unwatch_locked(
+        self, poll_interval: Optional[float], handler: FileSystemEventHandler, target: _Watch
+    ) -> None:
+        path, events = target
+        key = (poll_interval, path, events)
+        entry = self._watches.get(key)
+        if entry is None or handler not in entry[2]:
+            return
+        observer = self._observers[poll_interval]
+        entry[2].discard(handler)
+        if entry[2]:
+            observer.remove_handler_for_watch(handler, entry[0])
+        else:
+            observer.unschedule(entry[0])
+            del self._watches[key]
+
+
+_SHARED_OBSERVERS = _SharedObservers()
+
+
+def _release_watches(
+    poll_interval: Optional[float], handler: "_ConfigFileChangeHandler", watched: Set[_Watch]
+) -> None:
+    """Detach *handler* from everything in *watched*; used by ``close()``."""
+    handler.cancel()
+    _SHARED_OBSERVERS.release(poll_interval, handler, watched)
+
 
 class _ConfigFileChangeHandler(FileSystemEventHandler):
-    """Internal watchdog handler that triggers a reload on file modification."""
+    """Internal watchdog handler that triggers a reload on file modification.
+
+    The handler only holds a weak reference to its parser: the shared
+    observer keeps handlers alive, and must not keep parsers alive with them.
+    """
+
+    def __init__(
+        self,
+        parser: "AutoConfigParser",
+        reload_on_modify: bool = True,
+        debounce: float = 0.05,
+    ) -> None:
+        self._parser = weakref.ref(parser)
+        self.reload_on_modify = reload_on_modify
+        self._debounce = debounce
+        self._timer: Optional[threading.Timer] = None
+        self._timer_lock = threading.Lock()
+        self.retarget(parser)
+
+    def _schedule_reload(self) -> None:
+        """Reload once *debounce* seconds after the last of a burst of events.
 
-    def __init__(self, parser: "AutoConfigParser") -> None:
-        self._parser = parser
+        The reload always runs on the timer thread, never on the observer
+        thread, because reloading may reschedule watches on the observer.
+        Nothing is scheduled once the parser is gone; its watches are released
+        by the next call into the shared observers.
+        """
+        if self._parser() is None:
+            return
+        with self._timer_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self._debounce, self._reload)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _reload(self) -> None:
+        parser = self._parser()
+        if parser is not None:
+            parser._reload_from_disk()
+
+    def cancel(self) -> None:
+        """Drop a pending debounced reload, if any."""
+        with self._timer_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def retarget(self, parser: "AutoConfigParser") -> None:
+        """Cache the paths events are matched against; call after re-resolving.
+
+        Every watch is scheduled on an absolute path and watchdog reports
+        events relative to the watched path, so the file only ever shows up
+        as the path it was opened by or as its resolved path, and a symlink
+        it is reached through as that symlink's path. Matching is a set
+        lookup on normalized paths; symlinks are only re-resolved, by the
+        parser's reload, when an event shows them changing.
+        """
+        self._target_paths = {
+            _normalize(path)
+            for path in (str(parser._file_path), parser._abs_path, *parser._links)
+        }
+
+    def _is_target(self, path: str) -> bool:
+        return _normalize(path) in self._target_paths
 
     def on_modified(self, event):  # type: ignore[override]
         ### detect modification of only the target file
         if (
-            not event.is_directory
-            and Path(event.src_path).resolve() == self._parser._file_path
+            self.reload_on_modify
+            and not event.is_directory
+            and self._is_target(event.src_path)
         ):
-            self._parser._reload_from_disk()
+            self._schedule_reload()
+
+    def on_closed(self, event):  # type: ignore[override]
+        ### detect the target file being closed after a write
+        if not event.is_directory and self._is_target(event.src_path):
+            self._schedule_reload()
+
+    def on_created(self, event):  # type: ignore[override]
+        ### detect the target file, or a symlink on its path, being recreated
+        if self._is_target(event.src_path):
+            self._schedule_reload()
+
+    def on_moved(self, event):  # type: ignore[override]
+        ### detect atomic-rename saves onto, or moves away from, the target
+        if self._is_target(event.dest_path) or self._is_target(event.src_path):
+            self._schedule_reload()
 
     def on_deleted(self, event):  # type: ignore[override]
         ### detect deletion of anything, file or directory
-        self._parser._reload_from_disk()
+        self._schedule_reload()
 
 class AutoConfigParser(configparser.ConfigParser):
     """A drop-in replacement for ``configparser.ConfigParser`` with auto-reload.
@@ -46,34 +424,109 @@ class AutoConfigParser(configparser.ConfigParser):
     *args, **kwargs
         Additional positional and keyword arguments are forwarded to the
         ``configparser.ConfigParser`` constructor.
+    poll_interval : Optional[float], keyword-only
+        Watch the file by polling every *poll_interval* seconds (minimum 0.1)
+        instead of using native file-system notifications. Defaults to the
+        ``AUTO_CONFIG_PARSER_POLL_INTERVAL`` environment variable if it is a
+        number (other values are logged and ignored), else to 1 second when
+        the file is on a network filesystem (NFS, CIFS, ...) where native
+        notifications miss remote changes, else to native notifications.
+        Polling cost grows with the size of the watched directories, so raise
+        the interval for large ones.
+    debounce : float, keyword-only
+        Seconds to wait after the last change event before reloading, so that
+        the burst of events produced by a single save causes one reparse.
+        Defaults to 0.05; ``0`` reloads on every event without waiting.
+
+    Notes
+    -----
+    A file that cannot be parsed when the parser is created raises, like
+    ``ConfigParser.read_string``. If a later change makes it unparsable, the
+    error is logged as a warning on the ``auto_config_parser`` logger, once
+    per change, and reads keep returning the last values that loaded.
     """
 
-    def __init__(self, path: Union[str, Path], *args: Any, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *args: Any,
+        poll_interval: Optional[float] = None,
+        debounce: float = 0.05,
+        **kwargs: Any,
+    ) -> None:
+        # ConfigParser.__init__ may read through our overrides (e.g. to set up
+        # ``converters``); keep _ensure_watcher a no-op until we are set up
+        self._watching = True
+        # ``get`` results, as ``{(section, option, raw, optionxform assigned
+        # on the instance): (generation, value)}``
+        self._get_cache: Dict[Tuple[str, str, bool, Any], Tuple[int, Any]] = {}
+        self._generation = 0
+        # ``(generation, {(section, option): raw value})`` as of the last load;
+        # only used while no in-memory change has bumped the generation since
+        self._flat: Tuple[int, Dict[Tuple[str, str], Any]] = (-1, {})
+        # skip calling optionxform when it is the stock ``str.lower`` one
+        self._xform_is_lower = (
+            type(self).optionxform is configparser.RawConfigParser.optionxform
+        )
         super().__init__(*args, **kwargs)
+        self._parser_args = (args, kwargs)
+        self._interpolation_marker = _interpolation_marker(self._interpolation)
         self._original_path = Path(path) if isinstance(path, str) else path
-        self._file_path = Path(self._original_path).expanduser().resolve()
+        self._abs_path = os.path.abspath(os.path.expanduser(self._original_path))
+        self._file_path = Path(self._abs_path).resolve()
+        self._links = self._find_links()
         if not self._file_path.exists():  # create empty file if missing
             try:
                 self._file_path.touch()
             except Exception as e:
                 pass
 
+        # ``_lock`` guards the observer's lifecycle; ``_reload_lock`` makes
+        # reloads single-writer. Readers take neither.
         self._lock = threading.RLock()
-        self.handler = _ConfigFileChangeHandler(self)
+        self._reload_lock = threading.Lock()
+        self._stat_cache: Optional[Tuple[int, int, int]] = None
+        self._digest: Optional[bytes] = None
+        self._closed = False
+        # the watcher is started lazily by the first read, see _ensure_watcher
+        self._watching = False
+        self._observer: Optional[BaseObserver] = None
+        self._watched: Set[_Watch] = set()
+        if poll_interval is None:
+            poll_interval = _env_poll_interval()
+        if poll_interval is None and _is_remote_fs(self._file_path):
+            poll_interval = _DEFAULT_POLL_INTERVAL
+        if poll_interval is not None:
+            poll_interval = max(float(poll_interval), _MIN_POLL_INTERVAL)
+        self._poll_interval = poll_interval
+        self.handler = _ConfigFileChangeHandler(
+            self,
+            reload_on_modify=poll_interval is not None or not _EMITS_CLOSE_EVENTS,
+            debounce=debounce,
+        )
+        # stop watching once the parser is garbage collected; the callback
+        # only holds the handler and the watched set, not ``self``, and only
+        # queues the release since it may run while a lock is held.
+        # Not run at exit: the observer threads are daemons and die anyway.
+        self._finalizer = weakref.finalize(
+            self, _SHARED_OBSERVERS.defer_release, poll_interval, self.handler, self._watched
+        )
+        self._finalizer.atexit = False
 
         # initial load
-        self._reload_from_disk()
+        self._reload_from_disk(force=True)
 
     # ------------------------------------------------------------------
     # Public helpers
     # ------------------------------------------------------------------
     def close(self) -> None:
-        """Stop the background watchdog observer thread."""
+        """Stop watching the file; the shared observer thread keeps running."""
         with self._lock:
-            if getattr(self, "_observer", None) is not None:
-                self._observer.stop()
-                self._observer.join(timeout=5)
-                self._observer = None  # type: ignore[assignment]
+            self._closed = True
+            released = self._finalizer.detach()
+            if released is not None:
+                _release_watches(*released[2])
+            self._observer = None
 
     # context manager protocol -------------------------------------------------
     def __enter__(self):  # noqa: D401 (imperative mood not needed)
@@ -86,32 +539,191 @@ class AutoConfigParser(configparser.ConfigParser):
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
-    def _reload_from_disk(self) -> None:
-        """Reload the configuration from disk in a thread-safe manner."""
+    def _reload_from_disk(self, force: bool = False) -> None:
+        """Reload the configuration from disk in a thread-safe manner.
+
+        Readers are never blocked: the new state is parsed off to the side and
+        published with plain attribute assignments. Concurrent callers that
+        notice the same change wait for a single parse instead of each
+        repeating it.
+
+        Nothing is done if the file's stat signature is unchanged since the
+        last load, and the parsed state is left alone if the content is
+        byte-for-byte identical (e.g. after a ``touch`` or ``chmod``). *force*
+        skips the stat check and is used for the initial load, which does not
+        start the watcher yet.
+        """
+        key = self._stat_key()
+        if key == self._stat_cache and not force:
+            return
+
+        # re-resolve path
+        self._file_path = Path(self._abs_path).resolve()
+        self._links = self._find_links()
+        self.handler.retarget(self)
+        if self._watching:
+            self._rewatch()
+
+        with self._reload_lock:
+            self._load(force)
+
+    def _ensure_watcher(self) -> None:
+        """Start watching the file on first use rather than at construction."""
+        if self._watching:
+            return
         with self._lock:
-            # Clear current data
-            super().clear()
-            # re-resolve path
-            self._file_path = Path(self._original_path).expanduser().resolve()
-            # identify everything to watch
-            what_to_watch = [part for part in Path(self._original_path).parents if part.is_symlink()]
-            what_to_watch.append(self._file_path.parent)
-            what_to_watch.append(self._original_path)
-
-            # unschedule and reschedule to handle file recreation
-            if getattr(self, "_observer", None) is not None:
-                self._observer.unschedule_all()
-                for item in what_to_watch:
-                    self._observer.schedule(self.handler, item.as_posix(), recursive=False)
-
-            else:
-                self._observer = Observer()
-                for item in what_to_watch:
-                    self._observer.schedule(self.handler, item.as_posix(), recursive=False)
-                self._observer.daemon = True
-                self._observer.start()
-
-            super().read(self._file_path, encoding="utf-8")
+            if self._watching or self._closed:
+                return
+            self._watching = True
+            self._rewatch()
+        # catch up with any change made before the watch was in place
+        self._reload_from_disk()
+
+    def _rewatch(self) -> None:
+        """(Re)schedule watches for the current paths and drop stale ones."""
+        # identify everything to watch: the file itself for content changes,
+        # and the directories it is reached through for renames and deletions
+        file_events = _FILE_EVENTS
+        if self.handler.reload_on_modify:
+            file_events += (FileModifiedEvent,)
+        # the directory holding each symlink on the path sees it repointed
+        what_to_watch = [(os.path.dirname(link), _DIR_EVENTS) for link in self._links]
+        what_to_watch.append((str(self._file_path.parent), _DIR_EVENTS))
+        what_to_watch.append((self._abs_path, file_events))
+
+        # (re)schedule to handle file recreation, and drop watches that are no
+        # longer relevant
+        with self._lock:
+            if self._closed:
+                return
+            if self._observer is None:
+                self._observer = _SHARED_OBSERVERS.observer(self._poll_interval)
+            wanted = dict.fromkeys(what_to_watch)
+            for target in wanted:
+                if _SHARED_OBSERVERS.watch(self._poll_interval, self.handler, target):
+                    self._watched.add(target)
+                else:
+                    self._watched.discard(target)
+            for target in self._watched - wanted.keys():
+                _SHARED_OBSERVERS.unwatch(self._poll_interval, self.handler, target)
+                self._watched.discard(target)
+
+    def _find_links(self) -> Tuple[str, ...]:
+        """Return the symlinks among the file's path and its ancestors."""
+        abs_path = Path(self._abs_path)
+        return tuple(str(part) for part in (abs_path, *abs_path.parents) if part.is_symlink())
+
+    def _load(self, force: bool) -> None:
+        """Read, parse and publish the file; caller holds ``_reload_lock``."""
+        # another thread may have loaded this same change while we waited
+        if not force and self._stat_key() == self._stat_cache:
+            return
+
+        key, data = self._read_file()
+        digest = None if data is None else hashlib.blake2b(data, digest_size=16).digest()
+
+        if digest == self._digest:
+            self._stat_cache = key
+            return
+
+        # parse into a scratch parser first so that readers keep seeing the
+        # previous values until the swap below, and a file that fails to
+        # parse leaves them untouched
+        fresh = self._new_scratch_parser()
+        if data is not None:
+            try:
+                fresh.read_string(data.decode("utf-8"), source=str(self._file_path))
+            except Exception:
+                if force:  # the initial load has no previous values to keep
+                    raise
+                # whichever thread got here first (a reader's stat check or
+                # the watcher's timer), log the broken file once and keep
+                # serving the last good values until it changes again
+                _logger.warning(
+                    "Could not parse %s; keeping the previously loaded values",
+                    self._file_path,
+                    exc_info=True,
+                )
+                self._stat_cache = key
+                return
+
+        # publish by plain attribute assignment; readers never take a lock
+        proxies = self._dict()
+        for name in (self.default_section, *fresh._sections):
+            proxies[name] = configparser.SectionProxy(self, name)
+        # every (section, option) get() can see, with DEFAULT values merged
+        # in, so the common lookup is a single dict access
+        flat = {}
+        for name, options in ((self.default_section, {}), *fresh._sections.items()):
+            for option, value in fresh._defaults.items():
+                flat[(name, option)] = value
+            for option, value in options.items():
+                flat[(name, option)] = value
+        generation = self._generation + 1
+        self._sections = fresh._sections
+        self._defaults = fresh._defaults
+        self._proxies = proxies
+        self._flat = (generation, flat)
+        self._generation = generation
+        self._digest = digest
+        self._stat_cache = key
+
+    def _read_file(self) -> Tuple[Optional[Tuple[int, int, int]], Optional[bytes]]:
+        """Return the stat signature and raw bytes of the config file.
+
+        The file is read with ``os.read`` on one descriptor rather than
+        through a buffered text stream. Reading goes on until end of file,
+        since ``st_size`` is only a hint; the first read is sized from
+        ``fstat``, so a file normally takes one read plus the one that sees
+        EOF. The signature comes from the same descriptor, so it describes
+        the bytes returned. A missing file yields ``(None, None)`` and reads
+        as empty, like
+        ``ConfigParser.read``.
+        """
+        flags = os.O_RDONLY | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+        try:
+            fd = os.open(self._file_path, flags)
+        except OSError:
+            return None, None
+        try:
+            st = os.fstat(fd)
+            if hasattr(os, "posix_fadvise"):
+                # only a hint, which some filesystems reject
+                with contextlib.suppress(OSError):
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            # st_size is only a hint as well: some filesystems (FUSE mounts,
+            # ...) under-report it, and the file may grow while it is read
+            chunks = []
+            size = max(st.st_size, _READ_CHUNK_SIZE)
+            while True:
+                chunk = os.read(fd, size)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            data = b"".join(chunks)
+        finally:
+            os.close(fd)
+        return (st.st_mtime_ns, st.st_size, st.st_ino), data
+
+    def _new_scratch_parser(self) -> configparser.ConfigParser:
+        """Return an empty plain ``ConfigParser`` configured like this one."""
+        args, kwargs = self._parser_args
+        fresh = configparser.ConfigParser(*args, **kwargs)
+        fresh.optionxform = self.optionxform  # type: ignore[method-assign]
+        fresh.SECTCRE = self.SECTCRE
+        return fresh
+
+    def _stat_key(self) -> Optional[Tuple[int, int, int]]:
+        """Return ``(mtime_ns, size, inode)`` of the config file, or ``None``.
+
+        The original path is stat'ed (following symlinks) so that a symlink
+        being repointed at a different file is noticed as well.
+        """
+        try:
+            st = os.stat(self._abs_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
 
     # ------------------------------------------------------------------
     # Overridden public API to ensure reads are up-to-date
@@ -119,32 +731,185 @@ class AutoConfigParser(configparser.ConfigParser):
     # We override methods that *read* data to guarantee fresh view. Write
     # operations will internally update the file (if write is called) but chrono
     # isn't critical.
-    #def get(self, section: str, option: str, *args: Any, **kwargs: Any):  # type: ignore[override]
-    #    #self._reload_from_disk()
-    #    return super().get(section, option, *args, **kwargs)
+    def get(  # type: ignore[override]
+        self,
+        section: str,
+        option: str,
+        *,
+        raw: bool = False,
+        vars: Optional[Mapping[str, Any]] = None,
+        fallback: Any = configparser._UNSET,  # type: ignore[attr-defined]
+    ):
+        self._ensure_watcher()
+        # costs a single stat() unless the file on disk differs from what was
+        # last loaded (covers events the watcher missed or has not delivered)
+        self._reload_from_disk()
+        if vars is not None:
+            return super().get(section, option, raw=raw, vars=vars, fallback=fallback)
+
+        # results are cached until the next reload or in-memory change, which
+        # bumps the generation; read it before computing so a concurrent
+        # change can never be cached under the new generation. The key holds
+        # any optionxform assigned on the instance, since reassigning it
+        # changes which option a name refers to.
+        generation = self._generation
+        xform = self.__dict__.get("optionxform")
+        cache_key = (section, option, raw, xform)
+        hit = self._get_cache.get(cache_key)
+        if hit is not None and hit[0] == generation:
+            return hit[1]
+
+        # fast path: the option is set in the section (or DEFAULT) and its
+        # value contains nothing interpolation would change
+        if self._xform_is_lower and xform is None:
+            option_key = option.lower()
+        else:
+            option_key = self.optionxform(option)
+        flat_generation, flat = self._flat
+        if flat_generation == generation:
+            value = flat.get((section, option_key))
+        else:  # changed in memory since the last load
+            options = self._sections.get(section)
+            value = None if options is None else options.get(option_key)
+        marker = self._interpolation_marker
+        if not (
+            isinstance(value, str)
+            and (raw or marker == "" or (marker is not None and marker not in value))
+        ):
+            try:
+                value = super().get(section, option, raw=raw)
+            except (configparser.NoSectionError, configparser.NoOptionError):
+                if fallback is configparser._UNSET:  # type: ignore[attr-defined]
+                    raise
+                return fallback
+
+        if len(self._get_cache) >= _GET_CACHE_SIZE:
+            self._get_cache.clear()
+        self._get_cache[cache_key] = (generation, value)
+        return value
+
+    # in-memory changes invalidate cached ``get`` results -----------------------
+    def set(self, section: str, option: str, value: Optional[str] = None) -> None:
+        super().set(section, option, value)
+        self._generation += 1
+
+    def remove_option(self, section: str, option: str) -> bool:
+        existed = super().remove_option(section, option)
+        self._generation += 1
+        return existed
+
+    def remove_section(self, section: str) -> bool:
+        existed = super().remove_section(section)
+        self._generation += 1
+        return existed
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._generation += 1
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._generation += 1
 
-    # NOTE: We intentionally avoid overriding methods such as ``sections`` or
-    # ``items`` that are internally used by ``configparser`` during mutation
-    # operations (e.g., ``clear``). Overriding them to reload from disk can
+    def defaults(self) -> Dict[str, Any]:
+        # the mapping is live and callers may change it, so treat every call
+        # as a change; changes made through a mapping kept from an earlier
+        # call are only seen after the next one (or the next reload)
+        self._generation += 1
+        return super().defaults()
+
+    def _read(self, fp, fpname) -> None:  # covers read, read_file and read_string
+        try:
+            super()._read(fp, fpname)  # type: ignore[misc]
+        finally:
+            self._generation += 1
+
+    # NOTE: We intentionally avoid making methods such as ``sections`` or
+    # ``items`` reload from disk: they are internally used by ``configparser``
+    # during mutation operations (e.g., ``clear``), and reloading there can
     # cause infinite recursion, as seen in the failing test. Instead, the
     # background watchdog observer keeps the internal state in sync, and we
     # only proactively reload for ``get`` where the convenience outweighs the
-    # risk.
+    # risk. ``get`` only reloads when the file's stat signature has changed.
+    # The read methods below merely make sure the watcher has been started.
+    def __getitem__(self, key: str) -> configparser.SectionProxy:
+        self._ensure_watcher()
+        return super().__getitem__(key)
+
+    def items(self, *args: Any, **kwargs: Any):  # type: ignore[override]
+        self._ensure_watcher()
+        return super().items(*args, **kwargs)
+
+    def sections(self) -> list:
+        self._ensure_watcher()
+        return super().sections()
+
+    def options(self, section: str) -> list:
+        self._ensure_watcher()
+        return super().options(section)
+
+    def has_section(self, section: str) -> bool:
+        self._ensure_watcher()
+        return super().has_section(section)
+
+    def has_option(self, section: str, option: str) -> bool:
+        self._ensure_watcher()
+        return super().has_option(section, option)
+
+    def __contains__(self, key: object) -> bool:
+        self._ensure_watcher()
+        return super().__contains__(key)
+
+    def __iter__(self):
+        self._ensure_watcher()
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        self._ensure_watcher()
+        return super().__len__()
 
     # ------------------------------------------------------------------
     # Write helpers remain unchanged but we ensure disk persistence
     # ------------------------------------------------------------------
     def write(self, fp, *args: Any, **kwargs: Any):  # type: ignore[override]
-        """Write to a file-like object *and* persist to the configured path."""
+        """Write to a file-like object *and* persist to the configured path.
+
+        The file is replaced atomically through a sibling temporary file, so
+        readers (and other processes) never see it half-written. Its new stat
+        signature and digest are recorded, so the events caused by our own
+        write do not trigger a reparse of what is already in memory.
+        """
         result = super().write(fp, *args, **kwargs)
         # After writing to external stream, save to internal file path as well.
-        with open(self._file_path, "w", encoding="utf-8") as f:
-            super().write(f)
+        buf = io.StringIO()
+        super().write(buf)
+        data = buf.getvalue().encode("utf-8")
+        with self._reload_lock:
+            # mkstemp picks a unique name (so parsers and processes writing
+            # the same file do not collide), refuses to follow a planted
+            # symlink (O_EXCL) and creates the file 0600; the target's mode
+            # is applied before any content is written
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self._file_path.parent, prefix=self._file_path.name + "."
+            )
+            try:
+                with open(fd, "wb") as f:
+                    if hasattr(os, "fchmod"):
+                        with contextlib.suppress(OSError):
+                            os.fchmod(fd, stat.S_IMODE(os.stat(self._file_path).st_mode))
+                    f.write(data)
+                    f.flush()
+                    # os.replace keeps inode and mtime, so this is the
+                    # signature the file will have once it is in place
+                    st = os.fstat(fd)
+                os.replace(tmp_path, self._file_path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_path)
+                raise
+            self._stat_cache = (st.st_mtime_ns, st.st_size, st.st_ino)
+            self._digest = hashlib.blake2b(data, digest_size=16).digest()
+        # the file watch was on the inode we just replaced
+        if self._watching:
+            self._rewatch()
         return result
-
-    # Ensure cleanup on GC ------------------------------------------------------
-    def __del__(self):  # noqa: D401 (imperative mood)
-        try:
-            self.close()
-        except Exception:
-            pass
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import configparser
+import gc
+import io
+import os
 import time
+import weakref
 
 import pytest
 
 from auto_config_parser import AutoConfigParser
+from auto_config_parser.auto_config_parser import _SHARED_OBSERVERS
 
 
 def test_auto_reload(tmp_path):
@@ -161,6 +167,32 @@ def test_auto_reload_from_recreated_symlinked_directory(tmp_path):
 
     assert parser.get("app", "mode", fallback=None) == "production"
 
+def test_watcher_follows_repointed_symlinked_directory(tmp_path):
+    """The watcher alone should notice a symlinked parent directory being repointed."""
+    first_dir = tmp_path / "first_config_dir"
+    first_dir.mkdir()
+    (first_dir / "app_settings.ini").write_text("""[app]\nmode = development\n""", encoding="utf-8")
+    second_dir = tmp_path / "second_config_dir"
+    second_dir.mkdir()
+    (second_dir / "app_settings.ini").write_text("""[app]\nmode = production\n""", encoding="utf-8")
+    symlink_dir = tmp_path / "symlink_dir"
+    symlink_dir.symlink_to(first_dir, target_is_directory=True)
+
+    parser = AutoConfigParser(symlink_dir / "app_settings.ini")
+    assert dict(parser.items("app", raw=True)) == {"mode": "development"}
+
+    # raw items() never goes through get(), so only a watcher event can refresh it
+    symlink_dir.unlink()
+    symlink_dir.symlink_to(second_dir, target_is_directory=True)
+    for _ in range(20):  # up to 2 seconds
+        if dict(parser.items("app", raw=True)) == {"mode": "production"}:
+            break
+        time.sleep(0.1)
+    else:
+        pytest.fail("Watcher did not follow the repointed symlinked directory")
+
+    parser.close()
+
 def test_auto_reload_where_passed_in_object_is_str(tmp_path):
     """AutoConfigParser should accept file path as string and reflect updates."""
     ini_path = tmp_path / "config.ini"
@@ -173,3 +205,370 @@ def test_auto_reload_where_passed_in_object_is_str(tmp_path):
     assert parser.getboolean("feature", "enabled", fallback=None) is False
 
     parser.close()
+
+def test_get_reloads_changed_file_without_watcher(tmp_path):
+    """get() should notice on-disk changes even when no watcher event arrives."""
+    ini_path = tmp_path / "settings.ini"
+    ini_path.write_text("""[server]\nport = 80\n""", encoding="utf-8")
+
+    parser = AutoConfigParser(ini_path)
+    parser.close()  # stop the watcher so only the stat check can reload
+
+    ini_path.write_text("""[server]\nport = 8080\n""", encoding="utf-8")
+    assert parser.get("server", "port") == "8080"
+
+def test_auto_reload_from_atomic_rename_save(tmp_path):
+    """The watcher should pick up editors that save via rename-over-target."""
+    ini_path = tmp_path / "settings.ini"
+    ini_path.write_text("""[server]\nhost = localhost\n""", encoding="utf-8")
+
+    parser = AutoConfigParser(ini_path)
+    assert dict(parser.items("server", raw=True)) == {"host": "localhost"}
+
+    # raw items() never goes through get(), so only a watcher event can refresh it
+    tmp_file = tmp_path / "settings.ini.swp"
+    tmp_file.write_text("""[server]\nhost = 10.0.0.1\n""", encoding="utf-8")
+    os.replace(tmp_file, ini_path)
+
+    for _ in range(20):  # up to 2 seconds
+        if dict(parser.items("server", raw=True)) == {"host": "10.0.0.1"}:
+            break
+        time.sleep(0.1)
+    else:
+        pytest.fail("Parser did not reflect renamed-over file within timeout")
+
+    parser.close()
+
+def test_auto_reload_with_polling_observer(tmp_path):
+    """A poll_interval should switch to polling and still pick up changes."""
+    ini_path = tmp_path / "settings.ini"
+    ini_path.write_text("""[server]\nhost = localhost\n""", encoding="utf-8")
+
+    parser = AutoConfigParser(ini_path, poll_interval=0.1)
+    assert dict(parser.items("server", raw=True)) == {"host": "localhost"}
+    assert type(parser._observer).__name__ == "PollingObserver"
+
+    ini_path.write_text("""[server]\nhost = example.org\n""", encoding="utf-8")
+
+    for _ in range(30):  # up to 3 seconds
+        if dict(parser.items("server", raw=True)) == {"host": "example.org"}:
+            break
+        time.sleep(0.1)
+    else:
+        pytest.fail("Polling parser did not reflect updated value within timeout")
+
+    parser.close()
+
+def test_malformed_poll_interval_env_is_ignored(tmp_path, monkeypatch, caplog):
+    """A non-numeric poll interval in the environment should warn, not raise."""
+    ini_path = tmp_path / "settings.ini"
+    ini_path.write_text("""[server]\nhost = localhost\n""", encoding="utf-8")
+    monkeypatch.setenv("AUTO_CONFIG_PARSER_POLL_INTERVAL", "fast")
+
+    with caplog.at_level("WARNING", logger="auto_config_parser"):
+        parser = AutoConfigParser(ini_path)
+    parser.close()
+    assert parser._poll_interval is None
+    assert "AUTO_CONFIG_PARSER_POLL_INTERVAL" in caplog.text
+    assert "'fast'" in caplog.text
+
+def test_burst_of_events_is_debounced(tmp_path):
+    """Several change events in quick succession should cause one reload."""
+    ini_path = tmp_path / "settings.ini"
+    ini_path.write_text("""[server]\nhost = localhost\n""", encoding="utf-8")
+
+    parser = AutoConfigParser(ini_path, debounce=0.1)
+    parser.close()
+
+    reloads = []
+    parser._reload_from_disk = lambda: reloads.append(time.monotonic())
+    for _ in range(5):
+        parser.handler._schedule_reload()
+    time.sleep(0.3)
+
+    assert len(reloads) == 1
+
+def test_unchanged_content_is_not_reparsed(tmp_path):
+    """Touching the file without changing it should keep the parsed state."""
+    ini_path = tmp_path / "settings.ini"
+    ini_path.write_text("""[server]\nhost = localhost\n""", encoding="utf-8")
+
+    parser = AutoConfigParser(ini_path)
+    parser.close()
+    parser.set("server", "host", "in-memory")
+
+    st = ini_path.stat()
+    os.utime(ini_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert parser.get("server", "host") == "in-memory"
+
+def test_unparsable_file_keeps_previous_values(tmp_path, caplog):
+    """A reload that fails to parse should not wipe the current values."""
+    ini_path = tmp_path / "settings.ini"
+    ini_path.write_text("""[server]\nhost = localhost\n""", encoding="utf-8")
+
+    parser = AutoConfigParser(ini_path)
+    parser.close()
+
+    ini_path.write_text("""[server]\nhost = a\nhost = b\n""", encoding="utf-8")
+    with caplog.at_level("WARNING", logger="auto_config_parser"):
+        assert parser.get("server", "host") == "localhost"
+        assert parser.get("server", "host") == "localhost"
+    assert len(caplog.records) == 1
+    assert caplog.records[0].exc_info[0] is configparser.DuplicateOptionError
+    assert dict(parser.items("server")) == {"host": "localhost"}
+
+    ini_path.write_text("""host = no section header\n""", encoding="utf-8")
+    with pytest.raises(configparser.MissingSectionHeaderError):
+        AutoConfigParser(ini_path)
+
+def test_parsers_share_one_observer(tmp_path):
+    """Parsers should share an observer, and closing one must not stop the other."""
+    first_ini = tmp_path / "first.ini"
+    second_ini = tmp_path / "second.ini"
+    first_ini.write_text("""[app]\nname = first\n""", encoding="utf-8")
+    second_ini.write_text("""[app]\nname = second\n""", encoding="utf-8")
+
+    first = AutoConfigParser(first_ini)
+    second = AutoConfigParser(second_ini)
+    assert first.get("app", "name") == "first"
+    assert second.get("app", "name") == "second"
+    assert first._observer is not None
+    assert first._observer is second._observer
+
+    first.close()
+    second_ini.write_text("""[app]\nname = updated\n""", encoding="utf-8")
+
+    for _ in range(20):  # up to 2 seconds
+        if dict(second.items("app", raw=True)) == {"name": "updated"}:
+            break
+        time.sleep(0.1)
+    else:
+        pytest.fail("Remaining parser stopped receiving updates")
+
+    second.close()
+
+def test_large_file_is_loaded(tmp_path):
+    """Large files should load and reload like small ones."""
+    ini_path = tmp_path / "large.ini"
+    filler = "".join(f"key{i} = {'x' * 64}\n" for i in range(2000))
+    ini_path.write_text(f"""[bulk]\n{filler}[server]\nhost = localhost\n""", encoding="utf-8")
+
+    parser = AutoConfigParser(ini_path)
+    parser.close()
+    assert parser.get("server", "host") == "localhost"
+    assert len(parser.options("bulk")) == 2000
+
+    ini_path.write_text(f"""[bulk]\n{filler}[server]\nhost = remotehost\n""", encoding="utf-8")
+    assert parser.get("server", "host") == "remotehost"
+
+    # rewritten in place, shorter than before
+    with open(ini_path, "w", encoding="utf-8") as f:
+        f.write("""[server]\nhost = truncated\n""")
+    assert parser.get("server", "host") == "truncated"
+    assert not parser.has_section("bulk")
+
+def test_file_is_read_to_eof_despite_filesystem_quirks(tmp_path, monkeypatch):
+    """Neither a rejected fadvise hint nor an under-reported size should break a load."""
+    ini_path = tmp_path / "settings.ini"
+    ini_path.write_text("""[server]\nhost = localhost\n""", encoding="utf-8")
+
+    real_fstat = os.fstat
+
+    def fstat_reporting_one_byte(fd):
+        st = list(real_fstat(fd))
+        st[6] = 1  # st_size
+        return os.stat_result(st)
+
+    def rejecting_fadvise(*args):
+        raise OSError(29, "Illegal seek")
+
+    monkeypatch.setattr(os, "fstat", fstat_reporting_one_byte)
+    monkeypatch.setattr(os, "posix_fadvise", rejecting_fadvise, raising=False)
+    parser = AutoConfigParser(ini_path)
+    parser.close()
+    assert parser.get("server", "host") == "localhost"
+
+def test_get_matches_configparser_semantics(tmp_path):
+    """get() should agree with ConfigParser for interpolation, defaults and raw."""
+    ini_path = tmp_path / "settings.ini"
+    ini_path.write_text(
+        """[DEFAULT]\nroot = /srv\n[paths]\ndata = %(root)s/data\nratio = 50%%\nName = plain\n""",
+        encoding="utf-8",
+    )
+
+    parser = AutoConfigParser(ini_path)
+    parser.close()
+    assert parser.get("paths", "data") == "/srv/data"
+    assert parser.get("paths", "data", raw=True) == "%(root)s/data"
+    assert parser.get("paths", "ratio") == "50%"
+    assert parser.get("paths", "NAME") == "plain"
+    assert parser.get("paths", "root") == "/srv"
+    assert parser.get("paths", "data", vars={"data": "override"}) == "override"
+    assert parser.get("paths", "missing", fallback="dflt") == "dflt"
+
+def test_cached_get_sees_in_memory_changes(tmp_path):
+    """Cached get() results must be dropped when values change in memory."""
+    ini_path = tmp_path / "settings.ini"
+    ini_path.write_text("""[server]\nhost = localhost\nurl = http://%(host)s/\n""", encoding="utf-8")
+
+    parser = AutoConfigParser(ini_path)
+    parser.close()
+    assert parser.get("server", "url") == "http://localhost/"
+
+    parser.set("server", "host", "example.org")
+    assert parser.get("server", "host") == "example.org"
+    assert parser.get("server", "url") == "http://example.org/"
+
+    parser.remove_option("server", "host")
+    assert parser.get("server", "host", fallback=None) is None
+
+    parser["server"] = {"host": "replaced"}
+    assert parser.get("server", "host") == "replaced"
+    assert parser.get("server", "url", fallback="gone") == "gone"
+
+def test_unreferenced_parser_is_collected_and_stops_watching(tmp_path):
+    """Dropping the last reference should free the parser and its watches."""
+    ini_path = tmp_path / "settings.ini"
+    ini_path.write_text("""[server]\nhost = localhost\n""", encoding="utf-8")
+
+    parser = AutoConfigParser(ini_path)
+    assert parser.get("server", "host") == "localhost"
+    handler = parser.handler
+    parser_ref = weakref.ref(parser)
+    del parser
+    gc.collect()
+    _SHARED_OBSERVERS.release_pending()
+
+    assert parser_ref() is None
+    assert not any(handler in entry[2] for entry in _SHARED_OBSERVERS._watches.values())
+
+def test_collecting_parser_while_observer_lock_is_held(tmp_path):
+    """A parser freed by a collection inside the shared lock must not deadlock."""
+    ini_path = tmp_path / "settings.ini"
+    ini_path.write_text("""[server]\nhost = localhost\n""", encoding="utf-8")
+
+    parser = AutoConfigParser(ini_path)
+    assert parser.get("server", "host") == "localhost"
+    handler = parser.handler
+    del parser
+    with _SHARED_OBSERVERS._lock:
+        gc.collect()  # hangs if the finalizer takes the lock
+
+    _SHARED_OBSERVERS.release_pending()
+    assert not any(handler in entry[2] for entry in _SHARED_OBSERVERS._watches.values())
+
+def test_watcher_starts_on_first_read(tmp_path):
+    """Constructing a parser should not watch anything until it is read."""
+    ini_path = tmp_path / "settings.ini"
+    ini_path.write_text("""[server]\nhost = localhost\n""", encoding="utf-8")
+
+    parser = AutoConfigParser(ini_path)
+    assert parser._observer is None
+
+    ini_path.write_text("""[server]\nhost = changed\n""", encoding="utf-8")
+    assert dict(parser.items("server", raw=True)) == {"host": "changed"}
+    assert parser._observer is not None
+
+    parser.close()
+
+def test_watcher_starts_from_membership_reads(tmp_path):
+    """options(), has_option() and ``in`` should start the watcher like get()."""
+    ini_path = tmp_path / "settings.ini"
+    ini_path.write_text("""[s]\na = 1\n""", encoding="utf-8")
+
+    parser = AutoConfigParser(ini_path)
+    assert parser.options("s") == ["a"]
+    assert not parser.has_option("s", "b")
+
+    ini_path.write_text("""[s]\na = 1\nb = 2\n[t]\n""", encoding="utf-8")
+    for _ in range(20):  # up to 2 seconds
+        if parser.options("s") == ["a", "b"]:
+            break
+        time.sleep(0.1)
+    else:
+        pytest.fail("options() view was never refreshed")
+
+    assert parser.has_option("s", "b")
+    assert "t" in parser
+    assert list(parser) == ["DEFAULT", "s", "t"]
+
+    parser.close()
+
+def test_event_paths_are_matched_after_normalization(tmp_path):
+    """Event paths spelled differently from the target should still match."""
+    ini_path = tmp_path / "settings.ini"
+    ini_path.write_text("""[server]\nhost = localhost\n""", encoding="utf-8")
+
+    parser = AutoConfigParser(ini_path)
+    parser.close()
+    assert parser.handler._is_target(os.path.join(str(tmp_path), ".", "settings.ini"))
+    assert not parser.handler._is_target(os.path.join(str(tmp_path), "other.ini"))
+
+def test_write_replaces_file_and_keeps_watching(tmp_path):
+    """write() should persist atomically without reparsing, and keep the watch alive."""
+    ini_path = tmp_path / "settings.ini"
+    ini_path.write_text("""[server]\nhost = localhost\n""", encoding="utf-8")
+
+    parser = AutoConfigParser(ini_path)
+    assert parser.get("server", "host") == "localhost"
+
+    parser.set("server", "host", "written")
+    parser.write(io.StringIO())
+    assert "host = written" in ini_path.read_text(encoding="utf-8")
+    assert [p.name for p in tmp_path.iterdir()] == ["settings.ini"]
+    st = ini_path.stat()
+    assert parser._stat_cache == (st.st_mtime_ns, st.st_size, st.st_ino)
+    time.sleep(0.2)  # let the events caused by our own write be handled
+
+    ini_path.write_text("""[server]\nhost = edited\n""", encoding="utf-8")
+    for _ in range(20):  # up to 2 seconds
+        if dict(parser.items("server", raw=True)) == {"host": "edited"}:
+            break
+        time.sleep(0.1)
+    else:
+        pytest.fail("Parser stopped watching the file after write()")
+
+    parser.close()
+
+def test_write_keeps_file_mode(tmp_path):
+    """write() should keep a private config private."""
+    ini_path = tmp_path / "settings.ini"
+    ini_path.write_text("""[server]\npassword = secret\n""", encoding="utf-8")
+    ini_path.chmod(0o600)
+
+    parser = AutoConfigParser(ini_path)
+    parser.close()
+    parser.set("server", "password", "changed")
+    parser.write(io.StringIO())
+
+    assert ini_path.stat().st_mode & 0o777 == 0o600
+    assert "password = changed" in ini_path.read_text(encoding="utf-8")
+
+def test_get_honours_reassigned_optionxform(tmp_path):
+    """Assigning optionxform should change how get() normalises option names."""
+    ini_path = tmp_path / "settings.ini"
+    ini_path.write_text("""[DEFAULT]\nTimeout = 5\n[server]\nhost = localhost\n""", encoding="utf-8")
+
+    parser = AutoConfigParser(ini_path)
+    parser.close()
+    assert parser.get("server", "TIMEOUT") == "5"
+    assert parser.get("DEFAULT", "timeout") == "5"
+
+    assert parser.get("server", "HOST") == "localhost"
+
+    parser.optionxform = str  # type: ignore[method-assign]
+    assert parser.get("server", "host") == "localhost"
+    with pytest.raises(configparser.NoOptionError):
+        parser.get("server", "HOST")
+
+def test_get_sees_changes_made_through_defaults(tmp_path):
+    """Changing the mapping returned by defaults() should show up in get()."""
+    ini_path = tmp_path / "settings.ini"
+    ini_path.write_text("""[DEFAULT]\nx = 1\n[server]\nhost = localhost\n""", encoding="utf-8")
+
+    parser = AutoConfigParser(ini_path)
+    parser.close()
+    assert parser.get("server", "x") == "1"
+
+    parser.defaults()["x"] = "2"
+    assert parser.get("server", "x") == "2"